@@ -1,10 +1,139 @@
 import secrets # Used for cryptographically secure random selection
+import random # SystemRandom draws from the same secure source as secrets
+import numbers # Checks that the batch size is a whole number
 import tkinter as tk # GUI Framework
-import pandas as pd # For creating and writing Excel files
+from tkinter import font as tkfont # Shared fonts for the GUI widgets
+import csv # For appending password records to a file Excel can open
 import os  # File system interactions
-import tkinter.simpledialog as simpledialog # Popup dialog for input
-import platform # Determine operating system for file opening
-from datetime import datetime # Timestamp for saved passwords
+import subprocess # Launches the file opener on macOS and Linux
+import sys # Determine operating system for file opening
+import time # Timestamp for saved passwords
+import threading # Compiles the long-password helper in the background
+from concurrent.futures import ThreadPoolExecutor # Saves passwords without freezing the GUI
+
+#----------------------------------------
+#          Character Pools
+#----------------------------------------
+# Each character category, in the same bit order used by create_pool()
+LOWERCASE = 'abcdefghijklmnopqrstuvwxyz'
+UPPERCASE = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+DIGITS = '0123456789'
+SYMBOLS = '!@#$%^&*()_+-=[]}{|;:,.<>/?'
+
+# Every possible pool is built once here, keyed by a bitmask of the selected categories
+# (bit 0 = lowercase, bit 1 = uppercase, bit 2 = numbers, bit 3 = symbols)
+_POOLS = {
+    mask: "".join(part for bit, part in enumerate((LOWERCASE, UPPERCASE, DIGITS, SYMBOLS)) if mask & (1 << bit))
+    for mask in range(16)
+}
+
+#----------------------------------------
+#          Compiled Fill Helper
+#----------------------------------------
+# Passwords longer than this use the Numba-compiled loop; shorter ones would not make up for the compile time
+_NUMBA_MIN_LENGTH = 4096
+
+# Holds the compiled helper once it has been built (None until first needed, False if Numba is missing)
+_fill = None
+
+# Makes sure the helper is only compiled once when the GUI's background thread and a caller both ask for it
+_fill_lock = threading.Lock()
+
+def _get_fill():
+    """
+    This compiles the rejection-sampling loop with Numba the first time it is needed.
+    Returns None if Numba is not installed so the caller can use the plain Python loop instead.
+    """
+
+    global _fill
+
+    with _fill_lock:
+        if _fill is None:
+            _fill = _compile_fill()
+
+    return _fill or None
+
+def _compile_fill():
+    """
+    This builds the Numba version of the fill loop, or returns False if Numba is not installed.
+    """
+
+    try:
+        from numba import njit, types
+    except ImportError:
+        return False
+
+    @njit(cache=True)
+    def fill(out, pool, raw, mask):
+        # Copies pool characters into out for every random byte that lands inside the pool,
+        # and returns how many characters were written
+        j = 0
+        for i in range(raw.size):
+            b = raw[i] & mask
+            if b < pool.size:
+                out[j] = pool[b]
+                j += 1
+                if j == out.size:
+                    break
+        return j
+
+    # Compiles up front for the exact types generate_password() passes: out is a writable slice, while
+    # pool and raw come from np.frombuffer() over bytes, which gives read-only arrays
+    read_only = types.Array(types.uint8, 1, "C", readonly=True)
+    fill.compile((types.uint8[::1], read_only, read_only, types.uint8))
+    return fill
+
+#----------------------------------------
+#          File Opener
+#----------------------------------------
+# The way to open a file with its default app depends on the OS, so it is picked once here
+if sys.platform == "win32":
+    _OPEN_FILE = os.startfile # Windows-only function
+else:
+    def _OPEN_FILE(path):
+        # macOS uses "open" and Linux desktops use "xdg-open"
+        subprocess.Popen(["open" if sys.platform == "darwin" else "xdg-open", path])
+
+#----------------------------------------
+#          Password Log
+#----------------------------------------
+# Name of the password log (Excel opens CSV files directly) and the header row written when it is created
+LOG_FILE = "passwords_log.csv"
+LOG_HEADER = ("Purpose", "Password", "Timestamp")
+
+# Workbook used by older versions of this program, moved into the CSV log the first time it runs
+OLD_SHEET_FILE = "passwords_sheet.xlsx"
+
+# Excel limits a text value inside a formula to 255 characters and a whole formula to 8192
+_EXCEL_TEXT_CHUNK = 127
+_EXCEL_FORMULA_LIMIT = 8192
+
+def _excel_text(value):
+    """
+    This wraps a value as ="..." so Excel shows it exactly as text when it opens the CSV.
+    Without this, Excel turns passwords like 0042 into numbers and ones starting with =, +, - or @ into formulas.
+    The log therefore holds Excel formulas, so other programs reading it will see ="0042" rather than 0042.
+    Raises ValueError for values too long to fit in an Excel formula.
+    """
+
+    value = "" if value is None else str(value)
+
+    # Long values are split into pieces joined with & to stay under the text limit
+    # (127 characters stays under 255 even when every quote is doubled)
+    chunks = [value[i:i + _EXCEL_TEXT_CHUNK].replace('"', '""') for i in range(0, len(value), _EXCEL_TEXT_CHUNK)]
+    formula = "=" + "&".join(f'"{chunk}"' for chunk in chunks or [""])
+
+    # Values too long for any formula are refused, since writing them as they are would let Excel change them
+    if len(formula) > _EXCEL_FORMULA_LIMIT:
+        raise ValueError(f"Too long to store as Excel text ({len(value)} characters).")
+    return formula
+
+#----------------------------------------
+#          GUI Styles
+#----------------------------------------
+# Colors shared by the labels/checkboxes and by the buttons
+LABEL_STYLE = dict(fg="black", bg="#2887BE")
+BUTTON_STYLE = dict(fg="black", bg="#058420")
 
 #----------------------------------------
 #          Password Generator Class
@@ -22,6 +151,10 @@ class Password_Generator:
         self.prefs ={}
         # The pool will contain all allowed characters based on the users preferences
         self.pool = ""
+        # The same pool as ASCII bytes, so characters can be picked and joined without building strings
+        self.pool_bytes = b""
+        # SystemRandom uses the operating system's secure random source, the same one secrets uses
+        self._sysrand = random.SystemRandom()
 
     def set_preferences(self, length, lowercase, uppercase, numbers, symbols):
         """
@@ -39,46 +172,89 @@ class Password_Generator:
     
     def create_pool(self):
         """
-        This builds a string of characters the generator can use.
+        This picks the string of characters the generator can use.
         Only characters from user-selected options are included.
         """
 
-        # This resets the pool each time a new password is requested.
-        self.pool= ""
+        # Each selected option turns on one bit, and the finished mask looks up
+        # the matching pool that was already built in _POOLS.
+        mask = (
+            (bool(self.prefs["lowercase"]) << 0)
+            | (bool(self.prefs["uppercase"]) << 1)
+            | (bool(self.prefs["numbers"]) << 2)
+            | (bool(self.prefs["symbols"]) << 3)
+        )
+        self.pool = _POOLS[mask]
+        self.pool_bytes = self.pool.encode("ascii")
+
+    def generate_password(self):
+        """
+        This creates the password by randomly selecting characters from the created pool using random.SystemRandom()
+        which is cryptographically secure compared to the default random functions.
+        """
+
+        length = self.prefs["length_input"]
 
-        # Each conditional block appends a category of characters to the pool,
-        # which ensures only selected character types are included.
+        # Very long passwords use the compiled loop when Numba is available
+        if length > _NUMBA_MIN_LENGTH:
+            fill = _get_fill()
+            if fill is not None:
+                import numpy as np
 
-        # Adds lowercase letters if it is chosen.
-        if self.prefs["lowercase"]:
-            self.pool += 'abcdefghijklmnopqrstuvwxyz'
-        
-        # Adds uppercase letters if it is chosen.
-        if self.prefs["uppercase"]: 
-            self.pool += 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+                # The mask keeps only the bits needed to index the pool (smallest power of two >= pool size)
+                mask = (1 << len(self.pool).bit_length()) - 1
 
-        # Adds digits if it is chosen.
-        if self.prefs["numbers"]: 
-            self.pool += '0123456789'
+                pool_arr = np.frombuffer(self.pool_bytes, dtype=np.uint8)
+                out = np.empty(length, dtype=np.uint8)
+                filled = 0
 
-        # Adds symbols if it is chosen.
-        if self.prefs["symbols"]: 
-            self.pool += '!@#$%^&*()_+-=[]}{|;:,.<>/?' 
+                # Keeps drawing random bytes until every position has been filled
+                while filled < length:
+                    raw = np.frombuffer(secrets.token_bytes((length - filled) * 2), dtype=np.uint8)
+                    filled += fill(out[filled:], pool_arr, raw, np.uint8(mask))
 
-    def generate_password(self):
+                return out.tobytes().decode("ascii")
+
+        # Picks every character code in one call and decodes them into the password at once
+        return bytes(self._sysrand.choices(self.pool_bytes, k=length)).decode("ascii")
+
+    def generate_passwords(self, n):
         """
-        This creates the password by randomly selecting characters from the created pool using secrets.choice() 
-        which is cryptographically secure compared to random.choice().
+        This creates n passwords at once using NumPy, so the random bytes for every
+        password are drawn and mapped onto the pool in one pass instead of one loop per character.
         """
-        
-        password = ""
 
-        # Loop repeats once per character in the password based on the preferred length
+        # This checks the inputs first, since an empty pool has no characters to map onto
+        # (checked before reading the length, which is not set until preferences are chosen)
+        if not self.pool:
+            raise ValueError("Select at least one character type.")
+
+        length = self.prefs["length_input"]
+        if length <= 0:
+            raise ValueError("Length has to be positive.")
+        if not isinstance(n, numbers.Integral):
+            raise TypeError("Number of passwords has to be a whole number.")
+        if n < 0:
+            raise ValueError("Number of passwords cannot be negative.")
+
+        # Imported here since it is only needed for batch generation
+        import numpy as np
+
+        total = n * length
+
+        # The pool as an array of character codes so it can be indexed all at once
+        pool_arr = np.frombuffer(self.pool_bytes, dtype=np.uint8)
 
-        # This picks a random character from the pool for each position in the password
-        for i in range(self.prefs["length_input"]):
-            password += secrets.choice(self.pool)
-        return password
+        # One random 32-bit word per character
+        words = np.frombuffer(secrets.token_bytes(total * 4), dtype=np.uint32)
+
+        # Multiplying by the pool size and keeping the top 32 bits maps each word onto the pool
+        # with no rejected draws and no branches (the bias is below pool size / 2**32)
+        indices = (words.astype(np.uint64) * len(pool_arr)) >> 32
+
+        # Decodes the whole batch once, then cuts it into one password per length characters
+        text = pool_arr[indices].tobytes().decode("ascii")
+        return [text[i:i + length] for i in range(0, total, length)]
 
 #---------------------------------
 #           GUI Class
@@ -97,15 +273,48 @@ class PasswordGUI:
         # This creates an instance of the generator class
         self.generator = Password_Generator()
 
+        # The last preferences given to the generator, so the pool is only rebuilt when they change
+        self._last_prefs = None
+
+        # A single background worker does all log file writes, so saves never overlap
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+
+        # Closing the window waits for any pending saves before exiting
+        self.master.protocol("WM_DELETE_WINDOW", self._flush_and_close)
+
+        # Fonts are created once and shared by every widget that uses them
+        self.title_font = tkfont.Font(family="Times New Roman", size=45, underline=1)
+        self.prompt_font = tkfont.Font(family="Times New Roman", size=30, slant="italic")
+        self.entry_font = tkfont.Font(family="Times New Roman", size=35)
+        self.purpose_font = tkfont.Font(family="Times New Roman", size=30)
+        self.button_font = tkfont.Font(family="Times New Roman", size=27, weight="bold")
+        self.warning_font = tkfont.Font(family="Times New Roman", size=27)
+        self.result_font = tkfont.Font(family="Times New Roman", size=20, weight="bold")
+        self.error_font = tkfont.Font(family="Arial", size=20)
+
+        # Every widget is placed in one frame, which is added to the window once at the end
+        container = tk.Frame(master, bg=LABEL_STYLE["bg"])
+        container.columnconfigure(0, weight=1)
+
         # This is the main title in the GUI
-        tk.Label(master, text="Password Generator", font=("Times New Roman", 45, "underline"), fg="black", bg="#2887BE").pack(padx=10, pady=(10, 0))
+        tk.Label(container, text="Password Generator", font=self.title_font, **LABEL_STYLE).grid(row=0, column=0, padx=10, pady=(10, 0))
 
         # This is a prompt for password length
-        tk.Label(master, text="Type In Value For Password Length:", font=("Times New Roman", 30, "italic"), fg="black", bg="#2887BE").pack(padx=10, pady=(10, 0))
+        tk.Label(container, text="Type In Value For Password Length:", font=self.prompt_font, **LABEL_STYLE).grid(row=1, column=0, padx=10, pady=(10, 0))
+
+        # Input box for length, watched so a long length can start compiling the long-password helper early
+        self.length_var = tk.StringVar()
+        self._fill_warming = False
+        self.length_var.trace_add("write", self._warm_fill)
+        self.length_entry = tk.Entry(container, font=self.entry_font, width=3, justify='center', textvariable=self.length_var)
+        self.length_entry.grid(row=2, column=0, padx=10, pady=10)
+
+        # This is a prompt for what the password is for
+        tk.Label(container, text="What Is This Password For?", font=self.prompt_font, **LABEL_STYLE).grid(row=3, column=0, padx=10, pady=(10, 0))
 
-        # Input box for length
-        self.length_entry = tk.Entry(master, font=("Times New Roman", 35), width=3, justify='center')
-        self.length_entry.pack(padx=10, pady=10)
+        # Input box for purpose (leave it empty to skip saving)
+        self.purpose_entry = tk.Entry(container, font=self.purpose_font, width=20, justify='center')
+        self.purpose_entry.grid(row=4, column=0, padx=10, pady=10)
 
         # Checkboxes for character options
         self.lower_var = tk.BooleanVar(value=False)
@@ -114,43 +323,90 @@ class PasswordGUI:
         self.sym_var = tk.BooleanVar(value=False)
 
         # Checkboxes displayed in the GUI
-        tk.Checkbutton(master, font=("Times New Roman", 30, "italic"), fg="black", bg="#2887BE", text="Include Lowercase?", variable=self.lower_var).pack(padx=10, pady=2)
-        tk.Checkbutton(master, font=("Times New Roman", 30, "italic"), fg="black", bg="#2887BE", text="Include Uppercase?", variable=self.upper_var).pack(padx=10, pady=2)
-        tk.Checkbutton(master, font=("Times New Roman", 30, "italic"), fg="black", bg="#2887BE", text="Include Numbers?", variable=self.num_var).pack(padx=10, pady=2)
-        tk.Checkbutton(master, font=("Times New Roman", 30, "italic"), fg="black", bg="#2887BE", text="Include Symbols?", variable=self.sym_var).pack(padx=10, pady=2)
+        tk.Checkbutton(container, font=self.prompt_font, **LABEL_STYLE, text="Include Lowercase?", variable=self.lower_var).grid(row=5, column=0, padx=10, pady=2)
+        tk.Checkbutton(container, font=self.prompt_font, **LABEL_STYLE, text="Include Uppercase?", variable=self.upper_var).grid(row=6, column=0, padx=10, pady=2)
+        tk.Checkbutton(container, font=self.prompt_font, **LABEL_STYLE, text="Include Numbers?", variable=self.num_var).grid(row=7, column=0, padx=10, pady=2)
+        tk.Checkbutton(container, font=self.prompt_font, **LABEL_STYLE, text="Include Symbols?", variable=self.sym_var).grid(row=8, column=0, padx=10, pady=2)
         
         # Button to trigger password creation
-        tk.Button(master, text="Generate Password", font=("Times New Roman", 27, "bold"), fg="black", command=self.generate_password, bg="#058420").pack(padx=10, pady=10)
+        tk.Button(container, text="Generate Password", font=self.button_font, command=self.generate_password, **BUTTON_STYLE).grid(row=9, column=0, padx=10, pady=10)
 
         # This is a warning label
-        tk.Label(master, text="*Do Not Have Excel File Open While Generating and Saving New Password!", font=("Times New Roman", 27), fg="#E3A849", bg="#2887BE").pack(padx=10, pady=(10, 10))
+        tk.Label(container, text="*Do Not Have Excel File Open While Generating and Saving New Password!", font=self.warning_font, fg="#E3A849", bg=LABEL_STYLE["bg"]).grid(row=10, column=0, padx=10, pady=(10, 10))
 
         # This button opens the Excel file 
-        tk.Button(master, text="Open Excel File", font=("Times New Roman", 27, "bold"), fg="black", command=self.open_excel, bg="#058420").pack(padx=10, pady=10)
+        tk.Button(container, text="Open Excel File", font=self.button_font, command=self.open_excel, **BUTTON_STYLE).grid(row=11, column=0, padx=10, pady=10)
 
         # This is a label for displaying generated passwords or errors.
-        self.result_label = tk.Label(master, text="", font=("Times New Roman", 20, "bold"), fg="white", bg="#811081")
-        self.result_label.pack(padx=10, pady=(10, 10))
+        self.result_label = tk.Label(container, text="", font=self.result_font, fg="white", bg="#811081")
+        self.result_label.grid(row=12, column=0, padx=10, pady=(10, 10))
+
+        # Adds the finished frame to the window in a single layout pass
+        container.pack(fill="both", expand=True)
+
+        # Moves passwords saved by older versions into the new log the first time it runs
+        if os.path.exists(OLD_SHEET_FILE) and not os.path.exists(LOG_FILE):
+            self._migrate_old_sheet()
+
+    def _migrate_old_sheet(self):
+        """
+        This copies the rows from the old Excel workbook into the CSV log.
+        The old workbook is left in place, and the result is shown in the GUI.
+        """
+
+        try:
+            # Imported here since it is only needed once, when the old workbook is found
+            from openpyxl import load_workbook
+
+            wb = load_workbook(OLD_SHEET_FILE, read_only=True)
+            rows = list(wb["Passwords"].iter_rows(min_row=2, max_col=len(LOG_HEADER), values_only=True))
+            wb.close()
+
+            with open(LOG_FILE, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(LOG_HEADER)
+                writer.writerows([_excel_text(value) for value in row] for row in rows)
+        except Exception as e:
+            # Points the user to the old workbook if it could not be copied (for example, openpyxl is not installed)
+            self.result_label.config(text=f"Older passwords are still in {OLD_SHEET_FILE}: {e}")
+            return
+
+        self.result_label.config(text=f"Moved {len(rows)} passwords from {OLD_SHEET_FILE} into {LOG_FILE}.")
+
+    def _warm_fill(self, *args):
+        """
+        This starts compiling the long-password helper on a background thread the first time
+        the typed length goes over _NUMBA_MIN_LENGTH. Numba is only loaded when it is likely to be used,
+        and usually finishes compiling before the user clicks Generate.
+        """
+
+        if self._fill_warming:
+            return
+
+        try:
+            length = int(self.length_var.get())
+        except ValueError:
+            return
+
+        if length > _NUMBA_MIN_LENGTH:
+            self._fill_warming = True
+            threading.Thread(target=_get_fill, daemon=True).start()
 
     #----------------------------------------------------
     #       Function to open existing Excel file
     #----------------------------------------------------
     def open_excel(self):
-        # Name of the excel file
-        file_path = "passwords_sheet.xlsx"
+        # Waits for any pending saves so every saved password is in the file before it is opened
+        self._io_pool.submit(lambda: None).result()
 
         # This ensures the file exists
-        if not os.path.exists(file_path):
+        if not os.path.exists(LOG_FILE):
             self.result_label.config(text="Excel file does not exist yet.")
             return
-        
-        # This means the opening method depends on OS
-        system = platform.system()
 
         try:
-            # os.startfile only works on Windows
-            if system == "Windows":
-                os.startfile(file_path) # Windows-only function
+            # Opens the file with the opener chosen for this OS
+            _OPEN_FILE(LOG_FILE)
         except Exception as e:
             # Displays any error while trying to open the file
             self.result_label.config(text=f"Error opening file: {e}")
@@ -173,7 +429,7 @@ class PasswordGUI:
 
             # This ensures length is not negative or zero
             if length <= 0:
-                self.result_label.config(text="Length has to be positive.", font=("Arial", 20))
+                self.result_label.config(text="Length has to be positive.", font=self.error_font)
                 return
         except ValueError:
             # User typed something that is not a number
@@ -186,11 +442,12 @@ class PasswordGUI:
         numbers = self.num_var.get()
         symbols = self. sym_var.get()
 
-        # This stores preferences
-        self.generator.set_preferences(length, lowercase, uppercase, numbers, symbols)
-
-        # This builds the character pool
-        self.generator.create_pool()
+        # This stores preferences and builds the character pool, unless nothing changed since last time
+        key = (length, lowercase, uppercase, numbers, symbols)
+        if key != self._last_prefs:
+            self.generator.set_preferences(*key)
+            self.generator.create_pool()
+            self._last_prefs = key
 
         # If the pool is empty, the user selected no character types
         if not self.generator.pool:
@@ -201,62 +458,71 @@ class PasswordGUI:
         password = self.generator.generate_password()
         self.result_label.config(text=password)
 
-        # This ask the user what the password is for
-        purpose = simpledialog.askstring("Purpose", "What is this password for?")
+        # This reads what the password is for from the main window
+        purpose = self.purpose_entry.get().strip()
 
         # Builds timestamp for records
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
 
-        # This saves only if the user provided a purpose
+        # This saves only if the user provided a purpose, on the background worker so the GUI stays responsive
         if purpose:
-            self.save_excel(purpose, password, timestamp)
+            future = self._io_pool.submit(self.save_excel, purpose, password, timestamp)
+            self.master.after(50, self._on_saved, future)
+
+            # Clears the purpose so the next password is only saved once the user types a new one
+            self.purpose_entry.delete(0, tk.END)
+
+    def _on_saved(self, future):
+        """
+        This shows an error in the GUI if a background save failed.
+        Tkinter widgets can only be touched from the main thread, so this checks
+        the save from the Tk event loop with after() instead of from the worker.
+        """
+
+        # Checks again shortly if the save is still running
+        if not future.done():
+            self.master.after(50, self._on_saved, future)
+            return
+
+        error = future.exception()
+        if error is not None:
+            self.result_label.config(text=f"Error saving password: {error}")
     
     #---------------------------------------
     #  Save Password Record To Excel File
     #---------------------------------------
     def save_excel(self, purpose, password, timestamp):
         """
-        This creates or appends password data into an Excel spreadsheet.
-        The spreadsheet has columns: Purpose, Password, and Timestamp.
+        This creates or appends password data into a CSV file that opens in Excel.
+        The file has columns: Purpose, Password, and Timestamp, all stored as Excel text.
+        """
+
+        # Every cell is converted to Excel text first, so nothing is written if a value is too long
+        # (converts purpose to uppercase for consistency)
+        row = [_excel_text(purpose.upper()), _excel_text(password), _excel_text(timestamp)]
+
+        # Checks before opening, since opening in append mode creates the file
+        is_new = not os.path.exists(LOG_FILE)
+
+        # The log is opened for each save, so a file that was replaced or moved while the program runs
+        # still gets every new row. Append mode only writes the new line and never reads the stored passwords.
+        with open(LOG_FILE, "a", newline="") as f:
+            writer = csv.writer(f)
+
+            # This writes the header row for first-time setup only
+            if is_new:
+                writer.writerow(LOG_HEADER)
+
+            # Every cell is written as Excel text so passwords are shown exactly as generated
+            writer.writerow(row)
+
+    def _flush_and_close(self):
+        """
+        This waits for pending saves to finish, then closes the window.
         """
 
-        # Converts data row into a DataFrame
-        df = pd.DataFrame([{
-            "Purpose": purpose.upper(), # Converts purpose to uppercase for consistency
-            "Password": password,
-            "Timestamp": timestamp
-        }])
-
-        file_path = "passwords_sheet.xlsx"
-
-        # This creates the excel file if it does not exist
-        if not os.path.exists(file_path):
-            # This creates file and sheet for first-time setup
-            with pd.ExcelWriter(file_path, engine="xlsxwriter") as writer:
-                df.to_excel(writer, index=False, sheet_name="Passwords")
-
-                # Adjusts the column widths for better readability
-                worksheet = writer.sheets["Passwords"]
-                worksheet.set_column(0, 0, 25)
-                worksheet.set_column(1, 1, 35)
-                worksheet.set_column(2, 2, 25)
-
-        # This appends passwords to the existing file
-        else:
-            # Reads previous stored passwords
-            existing = pd.read_excel(file_path)
-
-            # Combines old and new entries
-            updated = pd.concat([existing, df], ignore_index=True)
-
-            # Writes updated data back to the file
-            with pd.ExcelWriter(file_path, engine="xlsxwriter") as writer:
-                updated.to_excel(writer, index=False, sheet_name="Passwords")
-
-                worksheet = writer.sheets["Passwords"]
-                worksheet.set_column(0, 0, 25)
-                worksheet.set_column(1, 1, 35)
-                worksheet.set_column(2, 2, 25)
+        self._io_pool.shutdown(wait=True)
+        self.master.destroy()
 
 #------------------------
 #     Main Program